@@ -2,7 +2,6 @@
 # -*- coding: utf-8 -*-
 
 import argparse
-import re
 import os
 import csv
 
@@ -16,9 +15,6 @@ parser.add_argument("--html")
 parser.add_argument("--md")
 args = parser.parse_args()
 
-re_title = re.compile(r'<p class="title">\s*(.*)\s*<\/p>', re.RegexFlag.MULTILINE)
-re_check = re.compile(r'<a.*title="(.*)">\s*(.)\s*<\/a>', re.RegexFlag.MULTILINE)
-
 summary = []
 
 with open(args.results) as f:
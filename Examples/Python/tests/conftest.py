@@ -285,8 +285,7 @@ def detector_config(request):
         raise ValueError(f"Invalid detector {detector}")
 
 
-@pytest.fixture
-def ptcl_gun(rng):
+def _make_ptcl_gun(rng):
     def _factory(s):
         evGen = acts.examples.EventGenerator(
             level=acts.logging.INFO,
@@ -318,7 +317,13 @@ def ptcl_gun(rng):
 
 
 @pytest.fixture
-def fatras(ptcl_gun, trk_geo, rng):
+def ptcl_gun(rng):
+    return _make_ptcl_gun(rng)
+
+
+def _make_fatras(rng, trk_geo):
+    ptcl_gun = _make_ptcl_gun(rng)
+
     def _factory(s):
         evGen = ptcl_gun(s)
 
@@ -362,6 +367,95 @@ def fatras(ptcl_gun, trk_geo, rng):
     return _factory
 
 
+@pytest.fixture
+def fatras(trk_geo, rng):
+    return _make_fatras(rng, trk_geo)
+
+
+@pytest.fixture(scope="session")
+def root_particles_session(tmp_path_factory):
+    """
+    Write particles from the particle gun to a ROOT file once per session,
+    so reader tests only have to run the read side.
+    """
+    s = acts.examples.Sequencer(events=10, numThreads=1, logLevel=acts.logging.WARNING)
+    evGen = _make_ptcl_gun(acts.examples.RandomNumbers(seed=42))(s)
+
+    file = tmp_path_factory.mktemp("root_particles") / "particles.root"
+    s.addWriter(
+        acts.examples.RootParticleWriter(
+            level=acts.logging.WARNING,
+            inputParticles=evGen.config.outputParticles,
+            filePath=str(file),
+        )
+    )
+
+    s.run()
+
+    del s  # to properly close the root file
+
+    return file
+
+
+@pytest.fixture(scope="session")
+def csv_particles_session(tmp_path_factory):
+    s = acts.examples.Sequencer(events=10, numThreads=1, logLevel=acts.logging.WARNING)
+    evGen = _make_ptcl_gun(acts.examples.RandomNumbers(seed=42))(s)
+
+    out = tmp_path_factory.mktemp("csv_particles")
+    s.addWriter(
+        acts.examples.CsvParticleWriter(
+            level=acts.logging.WARNING,
+            inputParticles=evGen.config.outputParticles,
+            outputStem="particle",
+            outputDir=str(out),
+        )
+    )
+
+    s.run()
+
+    return out
+
+
+@pytest.fixture(scope="session")
+def csv_fatras_session(tmp_path_factory):
+    """
+    Write simulated hits and digitized measurements to CSV once per session.
+    """
+    detector, trk_geo, _ = acts.examples.GenericDetector.create()
+
+    s = acts.examples.Sequencer(events=10, numThreads=1)
+    evGen, simAlg, digiAlg = _make_fatras(
+        acts.examples.RandomNumbers(seed=42), trk_geo
+    )(s)
+
+    out = tmp_path_factory.mktemp("csv_fatras")
+
+    s.addWriter(
+        acts.examples.CsvMeasurementWriter(
+            level=acts.logging.INFO,
+            inputMeasurements=digiAlg.config.outputMeasurements,
+            inputClusters=digiAlg.config.outputClusters,
+            inputMeasurementSimHitsMap=digiAlg.config.outputMeasurementSimHitsMap,
+            outputDir=str(out),
+        )
+    )
+
+    # Write hits, so we can later construct the measurement-particles-map
+    s.addWriter(
+        acts.examples.CsvSimHitWriter(
+            level=acts.logging.INFO,
+            inputSimHits=simAlg.config.outputSimHits,
+            outputDir=str(out),
+            outputStem="hits",
+        )
+    )
+
+    s.run()
+
+    return out
+
+
 def _do_material_recording(d: Path):
     from material_recording import runMaterialRecording
 
@@ -12,15 +12,11 @@ from helpers import (
 import acts
 from acts import UnitConstants as u
 from acts.examples import (
-    RootParticleWriter,
     RootParticleReader,
     RootMaterialTrackReader,
     RootTrackSummaryReader,
-    CsvParticleWriter,
     CsvParticleReader,
-    CsvMeasurementWriter,
     CsvMeasurementReader,
-    CsvSimHitWriter,
     CsvSimHitReader,
     Sequencer,
 )
@@ -28,77 +24,37 @@ from acts.examples.odd import getOpenDataDetector, getOpenDataDetectorDirectory
 
 
 @pytest.mark.root
-def test_root_particle_reader(tmp_path, conf_const, ptcl_gun):
-    # need to write out some particles first
-    s = Sequencer(numThreads=1, events=10, logLevel=acts.logging.WARNING)
-    evGen = ptcl_gun(s)
+def test_root_particle_reader(conf_const, root_particles_session):
+    s = Sequencer(numThreads=-1, logLevel=acts.logging.WARNING)
 
-    file = tmp_path / "particles.root"
-    s.addWriter(
-        conf_const(
-            RootParticleWriter,
-            acts.logging.WARNING,
-            inputParticles=evGen.config.outputParticles,
-            filePath=str(file),
-        )
-    )
-
-    s.run()
-
-    del s  # to properly close the root file
-
-    # reset sequencer for reading
-
-    s2 = Sequencer(numThreads=1, logLevel=acts.logging.WARNING)
-
-    s2.addReader(
+    s.addReader(
         conf_const(
             RootParticleReader,
             acts.logging.WARNING,
             outputParticles="particles_input",
-            filePath=str(file),
+            filePath=str(root_particles_session),
         )
     )
 
     alg = AssertCollectionExistsAlg(
         "particles_input", "check_alg", acts.logging.WARNING
     )
-    s2.addAlgorithm(alg)
+    s.addAlgorithm(alg)
 
-    s2.run()
+    s.run()
 
     assert alg.events_seen == 10
 
 
 @pytest.mark.csv
-def test_csv_particle_reader(tmp_path, conf_const, ptcl_gun):
-    s = Sequencer(numThreads=1, events=10, logLevel=acts.logging.WARNING)
-    evGen = ptcl_gun(s)
-
-    out = tmp_path / "csv"
-
-    out.mkdir()
-
-    s.addWriter(
-        conf_const(
-            CsvParticleWriter,
-            acts.logging.WARNING,
-            inputParticles=evGen.config.outputParticles,
-            outputStem="particle",
-            outputDir=str(out),
-        )
-    )
-
-    s.run()
-
-    # reset the seeder
-    s = Sequencer(numThreads=1, logLevel=acts.logging.WARNING)
+def test_csv_particle_reader(conf_const, csv_particles_session):
+    s = Sequencer(numThreads=-1, logLevel=acts.logging.WARNING)
 
     s.addReader(
         conf_const(
             CsvParticleReader,
             acts.logging.WARNING,
-            inputDir=str(out),
+            inputDir=str(csv_particles_session),
             inputStem="particle",
             outputParticles="input_particles",
         )
@@ -161,43 +117,14 @@ def test_root_material_track_reader(material_recording):
 
 
 @pytest.mark.csv
-def test_csv_meas_reader(tmp_path, fatras, trk_geo, conf_const):
-    s = Sequencer(numThreads=1, events=10)
-    evGen, simAlg, digiAlg = fatras(s)
-
-    out = tmp_path / "csv"
-    out.mkdir()
-
-    s.addWriter(
-        CsvMeasurementWriter(
-            level=acts.logging.INFO,
-            inputMeasurements=digiAlg.config.outputMeasurements,
-            inputClusters=digiAlg.config.outputClusters,
-            inputMeasurementSimHitsMap=digiAlg.config.outputMeasurementSimHitsMap,
-            outputDir=str(out),
-        )
-    )
-
-    # Write hits, so we can later construct the measurement-particles-map
-    s.addWriter(
-        CsvSimHitWriter(
-            level=acts.logging.INFO,
-            inputSimHits=simAlg.config.outputSimHits,
-            outputDir=str(out),
-            outputStem="hits",
-        )
-    )
-
-    s.run()
-
-    # read back in
-    s = Sequencer(numThreads=1)
+def test_csv_meas_reader(conf_const, csv_fatras_session):
+    s = Sequencer(numThreads=-1)
 
     s.addReader(
         CsvSimHitReader(
             level=acts.logging.INFO,
-            outputSimHits=simAlg.config.outputSimHits,
-            inputDir=str(out),
+            outputSimHits="simhits",
+            inputDir=str(csv_fatras_session),
             inputStem="hits",
         )
     )
@@ -210,8 +137,8 @@ def test_csv_meas_reader(tmp_path, fatras, trk_geo, conf_const):
             outputMeasurementSimHitsMap="simhitsmap",
             outputSourceLinks="sourcelinks",
             outputMeasurementParticlesMap="meas_ptcl_map",
-            inputSimHits=simAlg.config.outputSimHits,
-            inputDir=str(out),
+            inputSimHits="simhits",
+            inputDir=str(csv_fatras_session),
         )
     )
 
@@ -229,31 +156,14 @@ def test_csv_meas_reader(tmp_path, fatras, trk_geo, conf_const):
 
 
 @pytest.mark.csv
-def test_csv_simhits_reader(tmp_path, fatras, conf_const):
-    s = Sequencer(numThreads=1, events=10)
-    evGen, simAlg, digiAlg = fatras(s)
-
-    out = tmp_path / "csv"
-    out.mkdir()
-
-    s.addWriter(
-        CsvSimHitWriter(
-            level=acts.logging.INFO,
-            inputSimHits=simAlg.config.outputSimHits,
-            outputDir=str(out),
-            outputStem="hits",
-        )
-    )
-
-    s.run()
-
-    s = Sequencer(numThreads=1)
+def test_csv_simhits_reader(conf_const, csv_fatras_session):
+    s = Sequencer(numThreads=-1)
 
     s.addReader(
         conf_const(
             CsvSimHitReader,
             level=acts.logging.INFO,
-            inputDir=str(out),
+            inputDir=str(csv_fatras_session),
             inputStem="hits",
             outputSimHits="simhits",
         )
@@ -17,8 +17,7 @@ u = acts.UnitConstants
 
 def runEventRecording(detectorConstructionFactory, outputDir, s=None):
     hepmc_dir = os.path.join(outputDir, "hepmc3")
-    if not os.path.exists(hepmc_dir):
-        os.mkdir(hepmc_dir)
+    os.makedirs(hepmc_dir, exist_ok=True)
 
     s = s or acts.examples.Sequencer(
         events=int(os.environ.get("NEVENTS", 100)), numThreads=1
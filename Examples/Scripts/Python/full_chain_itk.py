@@ -56,12 +56,8 @@ else:
         outputDirRoot=outputDir,
     )
 
-addFatras(
-    s,
-    trackingGeometry,
-    field,
-    rnd=rnd,
-    preSelectParticles=ParticleSelectorConfig(
+preSelectParticles = (
+    ParticleSelectorConfig(
         rho=(0.0 * u.mm, 28.0 * u.mm),
         absZ=(0.0 * u.mm, 1.0 * u.m),
         eta=(-4.0, 4.0),
@@ -69,7 +65,15 @@ addFatras(
         removeNeutral=True,
     )
     if ttbar_pu200
-    else ParticleSelectorConfig(),
+    else ParticleSelectorConfig()
+)
+
+addFatras(
+    s,
+    trackingGeometry,
+    field,
+    rnd=rnd,
+    preSelectParticles=preSelectParticles,
     outputDirRoot=outputDir,
 )
 
@@ -82,17 +86,22 @@ addDigitization(
     rnd=rnd,
 )
 
+truthSeedRanges = (
+    TruthSeedRanges(pt=(1.0 * u.GeV, None), eta=(-4.0, 4.0), nHits=(9, None))
+    if ttbar_pu200
+    else TruthSeedRanges()
+)
+itkSeedingAlgConfig = acts.examples.itk.itkSeedingAlgConfig(
+    acts.examples.itk.InputSpacePointsType.PixelSpacePoints
+)
+
 addSeeding(
     s,
     trackingGeometry,
     field,
-    TruthSeedRanges(pt=(1.0 * u.GeV, None), eta=(-4.0, 4.0), nHits=(9, None))
-    if ttbar_pu200
-    else TruthSeedRanges(),
+    truthSeedRanges,
+    *itkSeedingAlgConfig,
     seedingAlgorithm=SeedingAlgorithm.Default,
-    *acts.examples.itk.itkSeedingAlgConfig(
-        acts.examples.itk.InputSpacePointsType.PixelSpacePoints
-    ),
     initialSigmas=[
         1 * u.mm,
         1 * u.mm,
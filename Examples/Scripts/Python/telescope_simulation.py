@@ -26,8 +26,7 @@ if "__main__" == __name__:
     field = acts.ConstantBField(acts.Vector3(0, 0, 2 * u.T))
 
     outputDir = Path.cwd() / "telescope_simulation"
-    if not outputDir.exists():
-        outputDir.mkdir()
+    outputDir.mkdir(exist_ok=True)
 
     for geant, postfix in [(False, "fatras"), (True, "geant4")]:
         rnd = acts.examples.RandomNumbers(seed=42)
@@ -59,14 +59,15 @@ def runTruthTrackingGsf(
             rnd=rnd,
         )
     else:
+        inputParticlePath = inputParticlePath.resolve()
         acts.logging.getLogger("GSF Example").info(
-            "Reading particles from %s", inputParticlePath.resolve()
+            "Reading particles from %s", inputParticlePath
         )
         assert inputParticlePath.exists()
         s.addReader(
             acts.examples.RootParticleReader(
                 level=acts.logging.INFO,
-                filePath=str(inputParticlePath.resolve()),
+                filePath=str(inputParticlePath),
                 outputParticles="particles_input",
             )
         )
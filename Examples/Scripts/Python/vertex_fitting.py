@@ -38,12 +38,13 @@ def runVertexFitting(
         logger.info("Generating particles using Pythia8")
         addPythia8(s, rnd)
     else:
-        logger.info("Reading particles from %s", inputParticlePath.resolve())
+        inputParticlePath = inputParticlePath.resolve()
+        logger.info("Reading particles from %s", inputParticlePath)
         assert inputParticlePath.exists()
         s.addReader(
             acts.examples.RootParticleReader(
                 level=acts.logging.INFO,
-                filePath=str(inputParticlePath.resolve()),
+                filePath=str(inputParticlePath),
                 outputParticles=inputParticles,
             )
         )
@@ -74,14 +75,15 @@ def runVertexFitting(
         s.addAlgorithm(ptclSmearing)
         associatedParticles = selectedParticles
     else:
-        logger.info("Reading track summary from %s", inputTrackSummary.resolve())
+        inputTrackSummary = inputTrackSummary.resolve()
+        logger.info("Reading track summary from %s", inputTrackSummary)
         assert inputTrackSummary.exists()
         associatedParticles = "associatedTruthParticles"
         trackSummaryReader = acts.examples.RootTrackSummaryReader(
             level=acts.logging.VERBOSE,
             outputTracks=trackParameters,
             outputParticles=associatedParticles,
-            filePath=str(inputTrackSummary.resolve()),
+            filePath=str(inputTrackSummary),
         )
         s.addReader(trackSummaryReader)
 